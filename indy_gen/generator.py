@@ -2,7 +2,8 @@ import os
 import re
 
 from indy_gen.function import FunctionParameter, IndyFunction
-from indy_gen.translator import GoTranslator
+from indy_gen.schema import ResultSchema
+from indy_gen.translator import GoFunction, GoTranslator
 
 
 class GeneratorError(Exception):
@@ -60,21 +61,62 @@ class HeaderParser:
 
 
 class Generator:
-    def __init__(self, output_path, header_path):
+    def __init__(self, output_path, header_path, handle_managers=False, result_schema_path=None,
+                 async_variants=False):
         self._output_path = output_path
         self._header_path = header_path
+        self._handle_managers = handle_managers
         self._header_parser = HeaderParser(header_path)
-        self._go_translator = GoTranslator(self._output_path)
+        if result_schema_path:
+            self._result_schema = ResultSchema.load(result_schema_path)
+        else:
+            self._result_schema = None
+        self._go_translator = GoTranslator(self._output_path, self._result_schema, async_variants)
 
     def generate_output_files(self):
-        declarations = self._header_parser.parse_indy_header_files()
+        header_declarations = self._header_parser.parse_indy_header_files()
+        all_declarations = {}
+        for declarations in header_declarations.values():
+            all_declarations.update(declarations)
 
-        for header_file_name, declarations in declarations.items():
+        if self._result_schema:
+            self._check_result_schema(all_declarations)
+
+        for header_file_name, declarations in header_declarations.items():
             domain = header_file_name.replace('indy_', '').replace('.h', '')
             self._go_translator.translate(domain, declarations)
 
+        self._go_translator.translate_result_types()
+        self._go_translator.translate_futures()
+
+        if self._handle_managers:
+            self._go_translator.translate_handle_managers(all_declarations)
+
+    def _check_result_schema(self, declarations):
+        unknown_functions = set(self._result_schema.functions) - set(declarations)
+        if unknown_functions:
+            raise GeneratorError(f'Result schema refers to unknown functions: {", ".join(sorted(unknown_functions))}')
+
+        for function_name, results in self._result_schema.functions.items():
+            go_function = GoFunction.from_indy_function(declarations[function_name])
+            if not go_function.callback:
+                raise GeneratorError(f'Result schema refers to {function_name}, which has no callback')
+
+            result_params = {param.name: param for param in go_function.callback.parameters[2:]}
+            for result_name in results:
+                param = result_params.get(result_name)
+                if param is None:
+                    raise GeneratorError(f'Unknown result {result_name} in schema for {function_name}')
+                if param.type != 'string':
+                    raise GeneratorError(f'Cannot decode non-string result {result_name} of {function_name}')
+
     def generate_output_files_for_function(self, function_name):
         declarations = self._header_parser.parse_indy_header_files()
+        if self._result_schema:
+            all_declarations = {}
+            for header_declarations in declarations.values():
+                all_declarations.update(header_declarations)
+            self._check_result_schema(all_declarations)
 
         for header_file_name, declarations in declarations.items():
             for declaration in declarations.values():
@@ -0,0 +1,168 @@
+import json
+import re
+
+from .utils import to_camel_case
+
+
+class SchemaError(Exception):
+    pass
+
+
+
+class ResultField:
+    __slots__ = 'json_name', 'go_name', 'type'
+    SCALAR_TYPES = 'string', 'int64', 'uint64', 'float64', 'bool', 'raw'
+
+
+    def __init__(self, json_name, type):
+        self.json_name = json_name
+        self.go_name = self.go_name_from_json_name(json_name)
+        self.type = type
+
+    @staticmethod
+    def go_name_from_json_name(json_name):
+        name = to_camel_case(re.sub('[^A-Za-z0-9_]', '', json_name))
+        if not name or name[0].isdigit():
+            raise SchemaError(f'Cannot derive Go field name from JSON key: {json_name}')
+        return name[0].upper() + name[1:]
+
+    def element_type(self):
+        return self.type.replace('[]', '')
+
+    def __str__(self):
+        return f'JSON name: {self.json_name} Go name: {self.go_name} Type: {self.type}'
+
+
+
+class ResultType:
+    __slots__ = 'name', 'fields'
+
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+
+    def __str__(self):
+        field_string = '\n\t'.join(str(field) for field in self.fields)
+        return f'[ResultType]\nName: {self.name}\nFields:\n\t{field_string}\n'
+
+
+
+class ResultSchema:
+    """
+    Per-function JSON result schemas, loaded from a mapping file of the form:
+
+        {
+            "types": {
+                "CredentialDefinition": {"id": "string", "ver": "string", "value": "raw"}
+            },
+            "functions": {
+                "indy_get_cred_def": {"cred_def_json": "CredentialDefinition"}
+            }
+        }
+
+    Field types are one of ResultField.SCALAR_TYPES, a name from "types", or
+    either of those prefixed with "[]" for arrays.
+    """
+
+    TYPE_NAME_REGEX = re.compile('^[A-Za-z_][A-Za-z0-9_]*$')
+    GO_RESERVED_NAMES = {
+        'break', 'case', 'chan', 'const', 'continue', 'default', 'defer', 'else', 'fallthrough', 'for', 'func',
+        'go', 'goto', 'if', 'import', 'interface', 'map', 'package', 'range', 'return', 'select', 'struct',
+        'switch', 'type', 'var', 'any', 'bool', 'byte', 'complex64', 'complex128', 'error', 'float32', 'float64',
+        'int', 'int8', 'int16', 'int32', 'int64', 'rune', 'string', 'uint', 'uint8', 'uint16', 'uint32',
+        'uint64', 'uintptr',
+    }
+    GENERATED_NAMES = {
+        'Future', 'CompletionQueue', 'NewCompletionQueue', 'HandleCacheStats', 'jsonDecoder', 'decodeJSON',
+        'decodeCStringJSON', 'handleCache', 'handleEntry', 'newHandleCache', 'futureState', 'futureRegistry',
+        'pendingFutures', 'resolver',
+    }
+    GENERATED_SUFFIXES = 'Result', 'Future', 'Async', 'Callback', 'Handles'
+
+    @classmethod
+    def load(cls, schema_path):
+        with open(schema_path, 'r') as f:
+            try:
+                content = json.load(f)
+            except ValueError as e:
+                raise SchemaError(f'Failed to parse result schema {schema_path}. Error: {e}') from e
+
+        cls._check_mapping(content, 'Result schema')
+
+        types = {}
+        for type_name, fields in cls._check_mapping(content.get('types', {}), 'Schema types').items():
+            cls._check_mapping(fields, f'Type {type_name}')
+            result_fields = [ResultField(json_name, cls._check_type_name(type, f'field {json_name} of {type_name}'))
+                             for json_name, type in fields.items()]
+            types[type_name] = ResultType(type_name, result_fields)
+
+        functions = {}
+        for function_name, results in cls._check_mapping(content.get('functions', {}), 'Schema functions').items():
+            cls._check_mapping(results, f'Results of {function_name}')
+            functions[function_name] = {
+                to_camel_case(name): cls._check_type_name(type_name, f'result {name} of {function_name}')
+                for name, type_name in results.items()
+            }
+
+        schema = cls(types, functions)
+        schema.validate()
+        return schema
+
+    @staticmethod
+    def _check_mapping(value, description):
+        if not isinstance(value, dict):
+            raise SchemaError(f'{description} must be a JSON object, got {type(value).__name__}')
+        return value
+
+    @staticmethod
+    def _check_type_name(value, description):
+        if not isinstance(value, str):
+            raise SchemaError(f'Type of {description} must be a string, got {type(value).__name__}')
+        return value
+
+
+    def __init__(self, types, functions):
+        self.types = types
+        self.functions = functions
+
+    def validate(self):
+        for result_type in self.types.values():
+            if not self.TYPE_NAME_REGEX.match(result_type.name):
+                raise SchemaError(f'Type name {result_type.name} is not a valid Go identifier')
+            if result_type.name in ResultField.SCALAR_TYPES or result_type.name in self.GO_RESERVED_NAMES:
+                raise SchemaError(f'Type name {result_type.name} clashes with a builtin name')
+            if result_type.name in self.GENERATED_NAMES or result_type.name.endswith(self.GENERATED_SUFFIXES):
+                raise SchemaError(f'Type name {result_type.name} clashes with a generated Go name')
+
+            json_names = {}
+            for field in result_type.fields:
+                if field.go_name in json_names:
+                    raise SchemaError(f'Fields {json_names[field.go_name]} and {field.json_name} of '
+                                      f'{result_type.name} both map to Go field {field.go_name}')
+                json_names[field.go_name] = field.json_name
+
+                element_type = field.element_type()
+                if element_type not in ResultField.SCALAR_TYPES and element_type not in self.types:
+                    raise SchemaError(f'Unknown type {field.type} for field {field.json_name} of {result_type.name}')
+
+        for result_type in self.types.values():
+            self._check_recursion(result_type, [])
+
+        for function_name, results in self.functions.items():
+            for result_name, type_name in results.items():
+                if type_name not in self.types:
+                    raise SchemaError(f'Unknown type {type_name} for result {result_name} of {function_name}')
+
+    def _check_recursion(self, result_type, path):
+        # Struct fields are embedded by value, so only a slice can break a cycle
+        if result_type.name in path:
+            cycle = ' -> '.join(path[path.index(result_type.name):] + [result_type.name])
+            raise SchemaError(f'Type {result_type.name} contains itself: {cycle}')
+
+        for field in result_type.fields:
+            if field.type in self.types:
+                self._check_recursion(self.types[field.type], path + [result_type.name])
+
+    def results_for(self, function_name):
+        return self.functions.get(function_name, {})
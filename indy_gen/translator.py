@@ -1,7 +1,9 @@
+import json
 import os
 
 from indy_gen.function import FunctionParameter, IndyFunction
 
+from .schema import ResultField
 from .utils import to_camel_case, go_param_string, types_string, c_param_string, names_string
 
 
@@ -23,8 +25,12 @@ _C_CALL_CHECK = '''
         return {result_var_names}
     }}
 '''
+_RESULT_RECEIVING = '''
+    _res := <- resCh'''
+_FUTURE_RESULT_RECEIVING = '''
+    <-f.done
+    _res := f.result'''
 _RESULT_RETRIEVING = '''
-    _res := <- resCh
     res := _res.({expected_type})
 '''
 _RESULT_RETRIEVING_CHECK_SINGLE = '''
@@ -36,6 +42,889 @@ _RESULT_RETRIEVING_CHECK_MULTIPLE = '''
         res_err = fmt.Errorf("Libindy returned code: %d", res.{code_field_name})
 '''
 
+_REGISTER_ASYNC_CALL = '''
+	pointer, commandHandle, _, err := resolver.RegisterCall("{function_name}")
+	if err != nil {{
+	    return nil, fmt.Errorf("Failed to register call for {function_name}. Error: %s", err)
+	}}
+'''
+_C_CALL_ASYNC_CHECK = '''
+    if code != 0 {
+        pendingFutures.take(int32(commandHandle))
+        return nil, fmt.Errorf("Libindy returned code: %d", code)
+    }
+'''
+_FUTURE_SENDING = '''if future := pendingFutures.take(int32({command_handle})); future != nil {{
+		future.complete({result})
+	}} else {{
+		resCh <- {result}
+	}}'''
+_RESULT_DECODE_CHECK = '''
+    if res.decodeErr != nil {{
+        res_err = res.decodeErr
+        return {result_var_names}
+    }}
+'''
+
+_JSON_DECODER = """package indy
+
+/*
+#include <string.h>
+*/
+import "C"
+
+import (
+	"encoding/json"
+	"fmt"
+	"strconv"
+	"unicode/utf16"
+	"unicode/utf8"
+	"unsafe"
+)
+
+type jsonDecoder struct {
+	data []byte
+	pos  int
+}
+
+// decodeCStringJSON runs decode directly over the NUL terminated C buffer s.
+// Decoders copy out only the strings and raw values they keep, so the buffer
+// is never copied as a whole.
+func decodeCStringJSON(s *C.char, decode func(*jsonDecoder) error) (bool, error) {
+	n := int(C.strlen(s))
+	return decodeJSON(unsafe.Slice((*byte)(unsafe.Pointer(s)), n), decode)
+}
+
+// decodeJSON runs decode over a complete JSON document. It reports whether the
+// document was null, in which case decode is not called.
+func decodeJSON(data []byte, decode func(*jsonDecoder) error) (bool, error) {
+	d := &jsonDecoder{data: data}
+	null, err := d.readNull()
+	if err == nil && !null {
+		err = decode(d)
+	}
+	if err != nil {
+		return false, err
+	}
+	d.skipSpace()
+	if d.pos != len(d.data) {
+		return false, d.errorf("unexpected trailing data")
+	}
+	return null, nil
+}
+
+func (d *jsonDecoder) errorf(format string, args ...interface{}) error {
+	return fmt.Errorf("Invalid JSON at offset %d: %s", d.pos, fmt.Sprintf(format, args...))
+}
+
+func (d *jsonDecoder) skipSpace() {
+	for d.pos < len(d.data) {
+		switch d.data[d.pos] {
+		case ' ', '\\t', '\\n', '\\r':
+			d.pos++
+		default:
+			return
+		}
+	}
+}
+
+func (d *jsonDecoder) peek() byte {
+	d.skipSpace()
+	if d.pos < len(d.data) {
+		return d.data[d.pos]
+	}
+	return 0
+}
+
+func (d *jsonDecoder) consume(c byte) error {
+	if d.peek() != c {
+		return d.errorf("expected '%c'", c)
+	}
+	d.pos++
+	return nil
+}
+
+func (d *jsonDecoder) literal(word string) error {
+	if len(d.data)-d.pos < len(word) || string(d.data[d.pos:d.pos+len(word)]) != word {
+		return d.errorf("expected %s", word)
+	}
+	d.pos += len(word)
+	return nil
+}
+
+func (d *jsonDecoder) readNull() (bool, error) {
+	if d.peek() != 'n' {
+		return false, nil
+	}
+	return true, d.literal("null")
+}
+
+func (d *jsonDecoder) readObject(field func(key []byte) error) error {
+	if null, err := d.readNull(); null || err != nil {
+		return err
+	}
+	if err := d.consume('{'); err != nil {
+		return err
+	}
+	if d.peek() == '}' {
+		d.pos++
+		return nil
+	}
+
+	for {
+		key, err := d.readStringBytes()
+		if err != nil {
+			return err
+		}
+		if err := d.consume(':'); err != nil {
+			return err
+		}
+		if err := field(key); err != nil {
+			return err
+		}
+
+		switch d.peek() {
+		case ',':
+			d.pos++
+		case '}':
+			d.pos++
+			return nil
+		default:
+			return d.errorf("expected ',' or '}'")
+		}
+	}
+}
+
+func (d *jsonDecoder) readArray(elem func() error) error {
+	if null, err := d.readNull(); null || err != nil {
+		return err
+	}
+	if err := d.consume('['); err != nil {
+		return err
+	}
+	if d.peek() == ']' {
+		d.pos++
+		return nil
+	}
+
+	for {
+		if err := elem(); err != nil {
+			return err
+		}
+
+		switch d.peek() {
+		case ',':
+			d.pos++
+		case ']':
+			d.pos++
+			return nil
+		default:
+			return d.errorf("expected ',' or ']'")
+		}
+	}
+}
+
+func (d *jsonDecoder) readString() (string, error) {
+	if null, err := d.readNull(); null || err != nil {
+		return "", err
+	}
+	b, err := d.readStringBytes()
+	return string(b), err
+}
+
+// readStringBytes returns the unescaped contents of a string. Strings without
+// escapes are returned as a subslice of the input and must be copied by the
+// caller if they are kept.
+func (d *jsonDecoder) readStringBytes() ([]byte, error) {
+	if err := d.consume('"'); err != nil {
+		return nil, err
+	}
+
+	start := d.pos
+	for d.pos < len(d.data) {
+		c := d.data[d.pos]
+		switch {
+		case c == '"':
+			d.pos++
+			return d.data[start : d.pos-1], nil
+		case c == '\\\\':
+			return d.readEscapedString(start)
+		case c < 0x20:
+			return nil, d.errorf("control character in string")
+		}
+		d.pos++
+	}
+	return nil, d.errorf("unterminated string")
+}
+
+func (d *jsonDecoder) readEscapedString(start int) ([]byte, error) {
+	buf := make([]byte, d.pos-start, d.pos-start+16)
+	copy(buf, d.data[start:d.pos])
+
+	var encoded [utf8.UTFMax]byte
+	for d.pos < len(d.data) {
+		c := d.data[d.pos]
+		switch {
+		case c == '"':
+			d.pos++
+			return buf, nil
+		case c < 0x20:
+			return nil, d.errorf("control character in string")
+		case c != '\\\\':
+			buf = append(buf, c)
+			d.pos++
+			continue
+		}
+
+		if d.pos+1 >= len(d.data) {
+			break
+		}
+		escaped := d.data[d.pos+1]
+		d.pos += 2
+		switch escaped {
+		case '"', '\\\\', '/':
+			buf = append(buf, escaped)
+		case 'b':
+			buf = append(buf, '\\b')
+		case 'f':
+			buf = append(buf, '\\f')
+		case 'n':
+			buf = append(buf, '\\n')
+		case 'r':
+			buf = append(buf, '\\r')
+		case 't':
+			buf = append(buf, '\\t')
+		case 'u':
+			r, err := d.readHexRune()
+			if err != nil {
+				return nil, err
+			}
+			if utf16.IsSurrogate(r) {
+				r = d.readLowSurrogate(r)
+			}
+			n := utf8.EncodeRune(encoded[:], r)
+			buf = append(buf, encoded[:n]...)
+		default:
+			return nil, d.errorf("invalid escape '\\\\%c'", escaped)
+		}
+	}
+	return nil, d.errorf("unterminated string")
+}
+
+func (d *jsonDecoder) readLowSurrogate(high rune) rune {
+	pos := d.pos
+	if len(d.data)-pos >= 2 && d.data[pos] == '\\\\' && d.data[pos+1] == 'u' {
+		d.pos += 2
+		if low, err := d.readHexRune(); err == nil {
+			if r := utf16.DecodeRune(high, low); r != utf8.RuneError {
+				return r
+			}
+		}
+	}
+	d.pos = pos
+	return utf8.RuneError
+}
+
+func (d *jsonDecoder) readHexRune() (rune, error) {
+	if len(d.data)-d.pos < 4 {
+		return 0, d.errorf("short unicode escape")
+	}
+
+	var r rune
+	for _, c := range d.data[d.pos : d.pos+4] {
+		switch {
+		case '0' <= c && c <= '9':
+			c -= '0'
+		case 'a' <= c && c <= 'f':
+			c = c - 'a' + 10
+		case 'A' <= c && c <= 'F':
+			c = c - 'A' + 10
+		default:
+			return 0, d.errorf("invalid unicode escape")
+		}
+		r = r*16 + rune(c)
+	}
+	d.pos += 4
+	return r, nil
+}
+
+func (d *jsonDecoder) readNumberBytes() ([]byte, error) {
+	d.skipSpace()
+	start := d.pos
+	for d.pos < len(d.data) {
+		c := d.data[d.pos]
+		if ('0' <= c && c <= '9') || c == '-' || c == '+' || c == '.' || c == 'e' || c == 'E' {
+			d.pos++
+			continue
+		}
+		break
+	}
+	if d.pos == start {
+		return nil, d.errorf("expected number")
+	}
+	return d.data[start:d.pos], nil
+}
+
+func (d *jsonDecoder) readInt64() (int64, error) {
+	if null, err := d.readNull(); null || err != nil {
+		return 0, err
+	}
+	b, err := d.readNumberBytes()
+	if err != nil {
+		return 0, err
+	}
+	v, err := strconv.ParseInt(string(b), 10, 64)
+	if err != nil {
+		return 0, d.errorf("invalid int64 %s", b)
+	}
+	return v, nil
+}
+
+func (d *jsonDecoder) readUint64() (uint64, error) {
+	if null, err := d.readNull(); null || err != nil {
+		return 0, err
+	}
+	b, err := d.readNumberBytes()
+	if err != nil {
+		return 0, err
+	}
+	v, err := strconv.ParseUint(string(b), 10, 64)
+	if err != nil {
+		return 0, d.errorf("invalid uint64 %s", b)
+	}
+	return v, nil
+}
+
+func (d *jsonDecoder) readFloat64() (float64, error) {
+	if null, err := d.readNull(); null || err != nil {
+		return 0, err
+	}
+	b, err := d.readNumberBytes()
+	if err != nil {
+		return 0, err
+	}
+	v, err := strconv.ParseFloat(string(b), 64)
+	if err != nil {
+		return 0, d.errorf("invalid float64 %s", b)
+	}
+	return v, nil
+}
+
+func (d *jsonDecoder) readBool() (bool, error) {
+	switch d.peek() {
+	case 't':
+		return true, d.literal("true")
+	case 'f':
+		return false, d.literal("false")
+	case 'n':
+		return false, d.literal("null")
+	}
+	return false, d.errorf("expected boolean")
+}
+
+// readRaw returns a copy of the next value exactly as it appears in the input.
+func (d *jsonDecoder) readRaw() (json.RawMessage, error) {
+	d.skipSpace()
+	start := d.pos
+	if err := d.skipValue(); err != nil {
+		return nil, err
+	}
+	raw := make(json.RawMessage, d.pos-start)
+	copy(raw, d.data[start:d.pos])
+	return raw, nil
+}
+
+func (d *jsonDecoder) skipValue() error {
+	switch d.peek() {
+	case '{':
+		return d.readObject(func([]byte) error {
+			return d.skipValue()
+		})
+	case '[':
+		return d.readArray(d.skipValue)
+	case '"':
+		_, err := d.readStringBytes()
+		return err
+	case 't':
+		return d.literal("true")
+	case 'f':
+		return d.literal("false")
+	case 'n':
+		return d.literal("null")
+	}
+	_, err := d.readNumberBytes()
+	return err
+}
+"""
+
+_FUTURES = """package indy
+
+import (
+	"sync"
+)
+
+// Future is implemented by every generated XxxFuture. Done is closed once the
+// libindy callback has delivered the result, after which Wait does not block.
+type Future interface {
+	Done() <-chan struct{}
+	state() *futureState
+}
+
+type futureState struct {
+	mu     sync.Mutex
+	done   chan struct{}
+	result interface{}
+	owner  Future
+	queue  *CompletionQueue
+	queued bool
+}
+
+func (f *futureState) init(owner Future) {
+	f.done = make(chan struct{})
+	f.owner = owner
+}
+
+func (f *futureState) Done() <-chan struct{} {
+	return f.done
+}
+
+func (f *futureState) state() *futureState {
+	return f
+}
+
+func (f *futureState) complete(result interface{}) {
+	f.mu.Lock()
+	f.result = result
+	close(f.done)
+	queue := f.queue
+	f.mu.Unlock()
+
+	if queue != nil {
+		queue.push(f.owner)
+	}
+}
+
+type futureRegistry struct {
+	mu      sync.Mutex
+	futures map[int32]*futureState
+}
+
+var pendingFutures = &futureRegistry{futures: make(map[int32]*futureState)}
+
+func (r *futureRegistry) add(commandHandle int32, f *futureState) {
+	r.mu.Lock()
+	r.futures[commandHandle] = f
+	r.mu.Unlock()
+}
+
+func (r *futureRegistry) take(commandHandle int32) *futureState {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+
+	f, ok := r.futures[commandHandle]
+	if ok {
+		delete(r.futures, commandHandle)
+	}
+	return f
+}
+
+// CompletionQueue collects futures in the order they complete, so a single
+// goroutine can keep many libindy calls in flight and handle each result as
+// soon as it arrives.
+type CompletionQueue struct {
+	mu      sync.Mutex
+	pending int
+	ready   []Future
+	signal  chan struct{}
+}
+
+func NewCompletionQueue() *CompletionQueue {
+	return &CompletionQueue{signal: make(chan struct{}, 1)}
+}
+
+// Add panics if f has already been added to this or any other queue.
+func (q *CompletionQueue) Add(f Future) {
+	state := f.state()
+	state.mu.Lock()
+	if state.queued {
+		state.mu.Unlock()
+		panic("Future already added to a completion queue")
+	}
+	state.queued = true
+
+	q.mu.Lock()
+	q.pending++
+	q.mu.Unlock()
+
+	select {
+	case <-state.done:
+		state.mu.Unlock()
+		q.push(f)
+	default:
+		state.queue = q
+		state.mu.Unlock()
+	}
+}
+
+// Pending returns the number of added futures that have not been returned
+// by Next, Drain or Poll yet.
+func (q *CompletionQueue) Pending() int {
+	q.mu.Lock()
+	defer q.mu.Unlock()
+
+	return q.pending
+}
+
+// Next blocks until a future completes and returns it, or returns nil if
+// the queue holds no pending futures.
+func (q *CompletionQueue) Next() Future {
+	for {
+		q.mu.Lock()
+		if len(q.ready) > 0 {
+			f := q.ready[0]
+			q.ready[0] = nil
+			q.ready = q.ready[1:]
+			q.pending--
+			q.notifyLocked()
+			q.mu.Unlock()
+			return f
+		}
+		if q.pending == 0 {
+			q.mu.Unlock()
+			return nil
+		}
+		q.mu.Unlock()
+
+		<-q.signal
+	}
+}
+
+// Drain blocks until at least one future completes and appends every
+// completed future to dst. It returns dst unchanged if the queue holds no
+// pending futures.
+func (q *CompletionQueue) Drain(dst []Future) []Future {
+	for {
+		q.mu.Lock()
+		if len(q.ready) > 0 || q.pending == 0 {
+			dst = q.takeLocked(dst)
+			q.mu.Unlock()
+			return dst
+		}
+		q.mu.Unlock()
+
+		<-q.signal
+	}
+}
+
+// Poll appends every completed future to dst without blocking.
+func (q *CompletionQueue) Poll(dst []Future) []Future {
+	q.mu.Lock()
+	defer q.mu.Unlock()
+
+	return q.takeLocked(dst)
+}
+
+func (q *CompletionQueue) push(f Future) {
+	q.mu.Lock()
+	q.ready = append(q.ready, f)
+	q.notifyLocked()
+	q.mu.Unlock()
+}
+
+// takeLocked must be called with q.mu held.
+func (q *CompletionQueue) takeLocked(dst []Future) []Future {
+	dst = append(dst, q.ready...)
+	q.pending -= len(q.ready)
+	for i := range q.ready {
+		q.ready[i] = nil
+	}
+	q.ready = q.ready[:0]
+	return dst
+}
+
+// notifyLocked must be called with q.mu held.
+func (q *CompletionQueue) notifyLocked() {
+	if len(q.ready) == 0 {
+		return
+	}
+	select {
+	case q.signal <- struct{}{}:
+	default:
+	}
+}
+"""
+
+_HANDLE_CACHE = """package indy
+
+import (
+	"fmt"
+	"sync"
+	"time"
+)
+
+// HandleCacheStats is a snapshot of handle manager activity. Hits counts
+// opens served by an already open (or currently opening) handle, Misses
+// counts opens that reached libindy.
+type HandleCacheStats struct {
+	Hits      uint64
+	Misses    uint64
+	Evictions uint64
+	Open      int
+}
+
+type handleEntry struct {
+	key     string
+	handle  int32
+	refs    int
+	idleGen uint64
+	timer   *time.Timer
+	ready   chan struct{}
+	closing chan struct{}
+	err     error
+}
+
+type handleCache struct {
+	mu          sync.Mutex
+	entries     map[string]*handleEntry
+	byHandle    map[int32]*handleEntry
+	closeFunc   func(int32) error
+	onClose     func(int32, error)
+	idleTimeout time.Duration
+	stats       HandleCacheStats
+	closed      bool
+}
+
+func newHandleCache(closeFunc func(int32) error, idleTimeout time.Duration, onClose func(int32, error)) *handleCache {
+	return &handleCache{
+		entries:     make(map[string]*handleEntry),
+		byHandle:    make(map[int32]*handleEntry),
+		closeFunc:   closeFunc,
+		onClose:     onClose,
+		idleTimeout: idleTimeout,
+	}
+}
+
+func (c *handleCache) acquire(key string, open func() (int32, error)) (int32, error) {
+	c.mu.Lock()
+	entry, ok := c.entries[key]
+	for ok && entry.closing != nil && !c.closed {
+		c.mu.Unlock()
+		<-entry.closing
+		c.mu.Lock()
+		entry, ok = c.entries[key]
+	}
+	if c.closed {
+		c.mu.Unlock()
+		return 0, fmt.Errorf("Handle manager is closed")
+	}
+
+	if ok {
+		entry.refs++
+		entry.idleGen++
+		if entry.timer != nil {
+			entry.timer.Stop()
+			entry.timer = nil
+		}
+		c.stats.Hits++
+		c.mu.Unlock()
+
+		<-entry.ready
+		if entry.err != nil {
+			return 0, entry.err
+		}
+		return entry.handle, nil
+	}
+
+	entry = &handleEntry{key: key, refs: 1, ready: make(chan struct{})}
+	c.entries[key] = entry
+	c.stats.Misses++
+	c.mu.Unlock()
+
+	handle, err := open()
+
+	c.mu.Lock()
+	entry.handle = handle
+	entry.err = err
+	closed := c.closed
+	if err != nil {
+		delete(c.entries, key)
+	} else if closed {
+		entry.err = fmt.Errorf("Handle manager is closed")
+		c.beginClose(entry)
+	} else {
+		c.byHandle[handle] = entry
+	}
+	c.mu.Unlock()
+
+	if err == nil && closed {
+		c.closeEntry(entry)
+	}
+	close(entry.ready)
+
+	if entry.err != nil {
+		return 0, entry.err
+	}
+	return handle, nil
+}
+
+func (c *handleCache) release(handle int32) error {
+	c.mu.Lock()
+	entry, ok := c.byHandle[handle]
+	if !ok {
+		c.mu.Unlock()
+		return fmt.Errorf("Unknown handle: %d", handle)
+	}
+	if entry.refs == 0 {
+		c.mu.Unlock()
+		return fmt.Errorf("Handle already released: %d", handle)
+	}
+
+	entry.refs--
+	if entry.refs > 0 {
+		c.mu.Unlock()
+		return nil
+	}
+
+	if c.idleTimeout > 0 {
+		entry.idleGen++
+		idleGen := entry.idleGen
+		entry.timer = time.AfterFunc(c.idleTimeout, func() {
+			c.expire(entry, idleGen)
+		})
+		c.mu.Unlock()
+		return nil
+	}
+
+	c.beginClose(entry)
+	c.mu.Unlock()
+
+	return c.closeEntry(entry)
+}
+
+func (c *handleCache) expire(entry *handleEntry, idleGen uint64) {
+	c.mu.Lock()
+	if entry.refs > 0 || entry.idleGen != idleGen || entry.closing != nil {
+		c.mu.Unlock()
+		return
+	}
+	c.beginClose(entry)
+	c.stats.Evictions++
+	c.mu.Unlock()
+
+	c.closeEntry(entry)
+}
+
+// closeAll closes every open handle and makes later opens fail. It returns
+// once opens and closes already in flight have completed; handles from
+// those opens are closed as they arrive.
+func (c *handleCache) closeAll() error {
+	c.mu.Lock()
+	c.closed = true
+	var entries, inFlight []*handleEntry
+	for _, entry := range c.entries {
+		select {
+		case <-entry.ready:
+		default:
+			inFlight = append(inFlight, entry)
+			continue
+		}
+		if entry.closing != nil {
+			inFlight = append(inFlight, entry)
+			continue
+		}
+
+		if entry.timer != nil {
+			entry.timer.Stop()
+			entry.timer = nil
+		}
+		entry.idleGen++
+		c.beginClose(entry)
+		entries = append(entries, entry)
+	}
+	c.mu.Unlock()
+
+	var firstErr error
+	for _, entry := range entries {
+		if err := c.closeEntry(entry); err != nil && firstErr == nil {
+			firstErr = err
+		}
+	}
+	for _, entry := range inFlight {
+		<-entry.ready
+		if entry.closing != nil {
+			<-entry.closing
+		}
+	}
+	return firstErr
+}
+
+func (c *handleCache) snapshot() HandleCacheStats {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	stats := c.stats
+	stats.Open = len(c.byHandle)
+	return stats
+}
+
+// beginClose must be called with c.mu held. The entry keeps its key until
+// closeEntry has finished, so opens of the same key wait for the close
+// instead of racing it.
+func (c *handleCache) beginClose(entry *handleEntry) {
+	delete(c.byHandle, entry.handle)
+	entry.closing = make(chan struct{})
+}
+
+func (c *handleCache) closeEntry(entry *handleEntry) error {
+	err := c.closeFunc(entry.handle)
+	if c.onClose != nil {
+		c.onClose(entry.handle, err)
+	}
+
+	c.mu.Lock()
+	if c.entries[entry.key] == entry {
+		delete(c.entries, entry.key)
+	}
+	c.mu.Unlock()
+	close(entry.closing)
+
+	return err
+}
+"""
+_HANDLE_MANAGER = """
+// {manager_name} reuses handles returned by {open_name}. Opens with equal
+// arguments share one handle, which is closed with {close_name} once it has
+// been released by every user and stayed idle for idleTimeout. A zero
+// idleTimeout closes the handle as soon as the last user releases it.
+// After CloseAll every further Open fails.
+type {manager_name} struct {{
+	cache *handleCache
+}}
+
+func New{manager_name}(idleTimeout time.Duration, onClose func(handle int32, err error)) *{manager_name} {{
+	return &{manager_name}{{cache: newHandleCache({close_name}, idleTimeout, onClose)}}
+}}
+
+func (m *{manager_name}) Open({params}) (int32, error) {{
+	key := fmt.Sprintf("{key_format}", {param_names})
+	return m.cache.acquire(key, func() (int32, error) {{
+		return {open_name}({param_names})
+	}})
+}}
+
+func (m *{manager_name}) Release(handle int32) error {{
+	return m.cache.release(handle)
+}}
+
+func (m *{manager_name}) Stats() HandleCacheStats {{
+	return m.cache.snapshot()
+}}
+
+func (m *{manager_name}) CloseAll() error {{
+	return m.cache.closeAll()
+}}
+"""
+
 class GoTranslator:
     GO_TO_CGO_TYPES = {
         'string': '*C.char',
@@ -68,16 +957,32 @@ class GoTranslator:
     }
 
 
-    def __init__(self, output_path):
+    RESULT_SCALAR_READERS = {
+        'string': 'readString',
+        'int64': 'readInt64',
+        'uint64': 'readUint64',
+        'float64': 'readFloat64',
+        'bool': 'readBool',
+        'raw': 'readRaw',
+    }
+
+
+    def __init__(self, output_path, result_schema=None, async_variants=False):
         self._output_path = output_path
+        self._result_schema = result_schema
+        self._async_variants = async_variants
 
     def translate_single(self, name, c_func):
         go_function = GoFunction.from_indy_function(c_func)
-        result_strings = self._generate_result_strings(go_function)
-        callback_name, callback_code = self._generate_callback(go_function, result_strings[1], result_strings[2])
+        decoded_results = self._apply_result_schema(c_func.name, go_function)
+        result_strings = self._generate_result_strings(go_function, decoded_results)
+        callback_name, callback_code = self._generate_callback(go_function, result_strings[1], result_strings[2],
+                                                               decoded_results)
         c_proxy_name, c_proxy_declaration, c_proxy_extern, c_proxy_code = self._generate_c_proxy(c_func, callback_name)
-        core_code = self._generate_core(go_function, c_func.name, c_proxy_name, result_strings[3])
+        core_code = self._generate_core(go_function, c_func.name, c_proxy_name, result_strings[3], decoded_results)
         print(core_code)
+        if self._async_variants:
+            print(self._generate_async_core(go_function, c_func.name, c_proxy_name, result_strings[3], decoded_results))
 
     def translate(self, name, functions):
         callbacks = []
@@ -89,10 +994,15 @@ class GoTranslator:
 
         for func_name, c_func in functions.items():
             go_function = GoFunction.from_indy_function(c_func)
-            result_strings = self._generate_result_strings(go_function)
-            callback_name, callback_code = self._generate_callback(go_function, result_strings[1], result_strings[2])
+            decoded_results = self._apply_result_schema(c_func.name, go_function)
+            result_strings = self._generate_result_strings(go_function, decoded_results)
+            callback_name, callback_code = self._generate_callback(go_function, result_strings[1], result_strings[2],
+                                                                   decoded_results)
             c_proxy_name, c_proxy_declaration, c_proxy_extern, c_proxy_code = self._generate_c_proxy(c_func, callback_name)
-            core_code = self._generate_core(go_function, c_func.name, c_proxy_name, result_strings[3])
+            core_code = self._generate_core(go_function, c_func.name, c_proxy_name, result_strings[3], decoded_results)
+            if self._async_variants:
+                core_code += '\n\n' + self._generate_async_core(go_function, c_func.name, c_proxy_name,
+                                                                  result_strings[3], decoded_results)
 
             callbacks.append(callback_code)
             c_proxy_declarations.append(c_proxy_declaration)
@@ -105,6 +1015,127 @@ class GoTranslator:
             self._populate_c_file(name, c_proxy_extern_declarations, c_proxies)
             self._populate_go_file(name, c_proxy_declarations, callbacks, result_struct_definitions, cores)
 
+    def translate_futures(self):
+        if not self._async_variants:
+            return
+
+        full_path = os.path.join(self._output_path, 'futures.go')
+
+        with open(full_path, 'w') as f:
+            f.write(_FUTURES)
+
+    def translate_result_types(self):
+        if not self._result_schema:
+            return
+
+        type_definitions = [self._generate_result_type(result_type)
+                            for result_type in self._result_schema.types.values()]
+        self._populate_results_file(type_definitions)
+
+    def _apply_result_schema(self, indy_function_name, go_function):
+        if not self._result_schema:
+            return {}
+
+        decoded_results = self._result_schema.results_for(indy_function_name)
+        result_params = {param.name: param for param in go_function.callback.parameters[2:]}
+        for result_name, type_name in decoded_results.items():
+            result_params[result_name].type = '*' + type_name
+
+        return decoded_results
+
+    def _generate_result_type(self, result_type):
+        field_declarations = []
+        field_cases = []
+        for field in result_type.fields:
+            field_type = self._go_result_type(field.type)
+            field_declarations.append(f'{field.go_name} {field_type} `json:{json.dumps(field.json_name)}`')
+            decoding = self._generate_value_decoding(f'v.{field.go_name}', field.type, '\t\t\t')
+            field_cases.append(f'case {json.dumps(field.json_name)}:\n\t\t\t{decoding}')
+        field_cases.append('default:\n\t\t\terr = d.skipValue()')
+
+        field_declaration_string = '\n\t'.join(field_declarations)
+        field_case_string = '\n\t\t'.join(field_cases)
+        struct_declaration = f'type {result_type.name} struct {{\n\t{field_declaration_string}\n}}'
+        decoder = (f'func (v *{result_type.name}) decodeJSON(d *jsonDecoder) error {{\n'
+                   f'\treturn d.readObject(func(key []byte) error {{\n\t\tvar err error\n'
+                   f'\t\tswitch string(key) {{\n\t\t{field_case_string}\n\t\t}}\n'
+                   f'\t\treturn err\n\t}})\n}}')
+        return f'{struct_declaration}\n\n{decoder}'
+
+    def _go_result_type(self, type):
+        if type.startswith('[]'):
+            return '[]' + self._go_result_type(type[2:])
+        elif type == 'raw':
+            return 'json.RawMessage'
+        else:
+            return type
+
+    def _generate_value_decoding(self, target, type, indent, depth=0):
+        if type.startswith('[]'):
+            element_type = type[2:]
+            element_name = f'elem{depth}'
+            element_decoding = self._generate_value_decoding(element_name, element_type, indent + '\t', depth + 1)
+            return (f'err = d.readArray(func() error {{\n'
+                    f'{indent}\tvar {element_name} {self._go_result_type(element_type)}\n{indent}\tvar err error\n'
+                    f'{indent}\t{element_decoding}\n{indent}\tif err != nil {{\n{indent}\t\treturn err\n{indent}\t}}\n'
+                    f'{indent}\t{target} = append({target}, {element_name})\n{indent}\treturn nil\n{indent}}})')
+        elif type in ResultField.SCALAR_TYPES:
+            return f'{target}, err = d.{self.RESULT_SCALAR_READERS[type]}()'
+        else:
+            return f'err = {target}.decodeJSON(d)'
+
+    def translate_handle_managers(self, functions):
+        managers = []
+
+        for func_name, c_func in functions.items():
+            if not func_name.startswith('indy_open_'):
+                continue
+            close_func = functions.get(func_name.replace('indy_open_', 'indy_close_', 1))
+            if close_func is None:
+                continue
+
+            open_function = GoFunction.from_indy_function(c_func)
+            close_function = GoFunction.from_indy_function(close_func)
+            if self._is_handle_pair(open_function, close_function):
+                managers.append(self._generate_handle_manager(open_function, close_function))
+
+        if managers:
+            self._populate_handles_file(managers)
+
+    def _is_handle_pair(self, open_function, close_function):
+        open_results = open_function.callback.parameters[2:]
+        close_params = close_function.parameters[1:]
+        close_results = close_function.callback.parameters[2:]
+        return (len(open_results) == 1 and open_results[0].type == 'int32' and
+                len(close_params) == 1 and close_params[0].type == 'int32' and
+                not close_results)
+
+    def _generate_handle_manager(self, open_function, close_function):
+        manager_name = open_function.name.replace('Open', '', 1) + 'Handles'
+        params = open_function.parameters[1:]
+        return _HANDLE_MANAGER.format(manager_name=manager_name,
+                                      open_name=open_function.name,
+                                      close_name=close_function.name,
+                                      params=go_param_string(params),
+                                      param_names=names_string(params),
+                                      key_format='\\x00'.join('%v' for _ in params))
+
+    def _populate_handles_file(self, managers):
+        full_path = os.path.join(self._output_path, 'handles.go')
+
+        with open(full_path, 'w') as f:
+            f.write(_HANDLE_CACHE)
+            f.write(''.join(managers))
+
+    def _populate_results_file(self, type_definitions):
+        full_path = os.path.join(self._output_path, 'results.go')
+
+        with open(full_path, 'w') as f:
+            f.write(_JSON_DECODER)
+            f.write('\n')
+            f.write('\n\n'.join(type_definitions))
+            f.write('\n')
+
     def _populate_c_file(self, domain, extern_declarations, proxies):
         full_path = os.path.join(self._output_path, domain + '.c')
 
@@ -137,24 +1168,34 @@ class GoTranslator:
             f.write('\n\n'.join(callbacks))
             f.write('\n\n')
 
-    def _generate_callback(self, go_function, result_initialisation, result_sending):
+    def _generate_callback(self, go_function, result_initialisation, result_value, decoded_results):
         callback_name = go_function.name[0].lower() + go_function.name[1:] + 'Callback'
         callback_export = '//export ' + callback_name
         callback_param_strings= []
         callback_param_types = []
         callback_param_names = []
         for param in go_function.callback.parameters:
-            param_type_cgo = self.GO_TO_CGO_TYPES[param.type]
+            if param.name in decoded_results:
+                param_type_cgo = '*C.char'
+            else:
+                param_type_cgo = self.GO_TO_CGO_TYPES[param.type]
             callback_param_strings.append(f'{param.name} {param_type_cgo}')
             callback_param_names.append(param.name)
             callback_param_types.append(param_type_cgo)
         callback_params = ', '.join(callback_param_strings)
-        go_var_names, go_var_declarations, go_var_setups = self._setup_go_variables(callback_param_names[1:], callback_param_types[1:])
+        go_var_names, go_var_declarations, go_var_setups = self._setup_go_variables(callback_param_names[1:], callback_param_types[1:],
+                                                                                    decoded_results)
         var_declaration_code = '\n\t'.join(go_var_declarations)
         err_setup_code = go_var_setups[0]
         setup_code = '\n\n\t'.join(go_var_setups[1:])
         signature = f'func {callback_name}({callback_params})'
         first_param_name = go_function.callback.parameters[0].name
+        if self._async_variants:
+            result_sending = _FUTURE_SENDING.format(command_handle=first_param_name, result=result_value)
+        else:
+            result_sending = f'resCh <- {result_value}'
+        if result_initialisation:
+            result_sending = '\t' + result_sending
         result_initialisation_lines = result_initialisation.split('\n')
         result_initialisation_error = '\n\t'.join(result_initialisation_lines)
         error_check = f'if go_err != 0 {{\n\t\t{result_initialisation_error}\n\t{result_sending}\n\t\treturn\n\t}}'
@@ -163,18 +1204,18 @@ class GoTranslator:
                          f'\t{err_setup_code}\n\t{error_check}\n\n\t{setup_code}\n\t{result_initialisation}{result_sending}\n}}')
         return callback_name, callback_code
 
-    def _generate_result_strings(self, go_function):
+    def _generate_result_strings(self, go_function, decoded_results):
         if len(go_function.callback.parameters) > 2:
-            return self._generate_result_strings_for_complex_result(go_function)
+            return self._generate_result_strings_for_complex_result(go_function, decoded_results)
         else:
             callback_res_name = go_function.callback.parameters[1].name
             callback_res_type = go_function.callback.parameters[1].type
-            sending = f'resCh <- go_{callback_res_name}'
+            sending = f'go_{callback_res_name}'
             receiving = _RESULT_RETRIEVING.format(expected_type=callback_res_type)
             receiving = f'{receiving}\t{_RESULT_RETRIEVING_CHECK_SINGLE}'
             return '', '', sending, receiving
 
-    def _generate_result_strings_for_complex_result(self, go_function):
+    def _generate_result_strings_for_complex_result(self, go_function, decoded_results):
         function_name_lower = go_function.name[0].lower() + go_function.name[1:]
         result_struct_name = f'{function_name_lower}Result'
         result_fields = go_function.callback.parameters[1:]
@@ -185,19 +1226,23 @@ class GoTranslator:
             else:
                 field_type = field.type
             struct_field_declarations.append(f'{field.name} {field_type}')
+        if decoded_results:
+            struct_field_declarations.append('decodeErr error')
         field_declaration_string = '\n\t'.join(struct_field_declarations)
         struct_declaration = f'type {result_struct_name} struct {{\n\t{field_declaration_string}\n}}'
 
         struct_field_initialisations = []
         for field in result_fields:
             struct_field_initialisations.append(f'{field.name}: go_{field.name}')
+        if decoded_results:
+            struct_field_initialisations.append('decodeErr: go_decodeErr')
         field_initialisation_string = ',\n\t\t'.join(struct_field_initialisations)
         struct_initialisation = f'res := &{result_struct_name} {{\n\t\t{field_initialisation_string},\n\t}}\n'
         receiving = _RESULT_RETRIEVING.format(expected_type='*' + result_struct_name)
         struct_err_field_name = go_function.callback.parameters[1].name
         receiving += f'\t{_RESULT_RETRIEVING_CHECK_MULTIPLE}'.format(code_field_name=struct_err_field_name)
 
-        return struct_declaration, struct_initialisation, '\tresCh <- res', receiving
+        return struct_declaration, struct_initialisation, 'res', receiving
 
     def _generate_c_proxy(self, indy_function, go_callback_name):
         extern_declaration_types = types_string(indy_function.callback.parameters)
@@ -215,7 +1260,52 @@ class GoTranslator:
         c_proxy_code = f'{c_proxy_signature} {{\n\t{function_cast}\n\t{function_invocation}\n}}'
         return c_proxy_name, c_proxy_declaration, extern_declaration, c_proxy_code
 
-    def _generate_core(self, go_indy_function, indy_function_name, c_proxy_name, result_retrieval):
+    def _generate_core(self, go_indy_function, indy_function_name, c_proxy_name, result_retrieval, decoded_results):
+        return_var_names, return_types = self._generate_return_values(go_indy_function)
+        return_var_names_string = ', '.join(return_var_names)
+        return_vars_init_string = self._generate_return_vars_init(return_var_names, return_types)
+        return_types_string = ', '.join(return_types)
+
+        params = go_param_string(go_indy_function.parameters[1:])
+
+        signature = f'func {go_indy_function.name}({params}) ({return_types_string})'
+
+        register_call = _REGISTER_CALL.format(function_name=indy_function_name,
+                                              result_var_names=return_var_names_string)
+        # handle = FunctionParameter('commandHandle', 'int32')
+        # variables = [handle] + go_indy_function.parameters
+        variable_setup_string, c_call = self._generate_c_call(go_indy_function, c_proxy_name)
+        c_call_check = _C_CALL_CHECK.format(result_var_names=return_var_names_string)
+        result_processing = self._generate_result_processing(_RESULT_RECEIVING + result_retrieval, return_var_names,
+                                                             decoded_results)
+
+        return (f'{signature} {{\n\t{return_vars_init_string}\n\t{register_call}'
+                f'\n\n\t{variable_setup_string}\n\n\t{c_call}\t{c_call_check}'
+                f'{result_processing}\n}}')
+
+    def _generate_async_core(self, go_indy_function, indy_function_name, c_proxy_name, result_retrieval, decoded_results):
+        future_name = go_indy_function.name + 'Future'
+        return_var_names, return_types = self._generate_return_values(go_indy_function)
+        return_vars_init_string = self._generate_return_vars_init(return_var_names, return_types)
+        return_types_string = ', '.join(return_types)
+        result_processing = self._generate_result_processing(_FUTURE_RESULT_RECEIVING + result_retrieval,
+                                                             return_var_names, decoded_results)
+        future_declaration = f'type {future_name} struct {{\n\tfutureState\n}}'
+        wait = (f'func (f *{future_name}) Wait() ({return_types_string}) {{\n\t{return_vars_init_string}\n'
+                f'{result_processing}\n}}')
+
+        params = go_param_string(go_indy_function.parameters[1:])
+        signature = f'func {go_indy_function.name}Async({params}) (*{future_name}, error)'
+        register_call = _REGISTER_ASYNC_CALL.format(function_name=indy_function_name)
+        variable_setup_string, c_call = self._generate_c_call(go_indy_function, c_proxy_name)
+        future_setup = (f'future := &{future_name}{{}}\n\tfuture.init(future)\n\t'
+                        f'pendingFutures.add(int32(commandHandle), &future.futureState)')
+        async_core = (f'{signature} {{{register_call}\n\t{variable_setup_string}\n\n\t{future_setup}\n\n\t'
+                      f'{c_call}\t{_C_CALL_ASYNC_CHECK}\n\treturn future, nil\n}}')
+
+        return f'{future_declaration}\n\n{wait}\n\n{async_core}'
+
+    def _generate_return_values(self, go_indy_function):
         return_parameters = go_indy_function.callback.parameters[1:]
         first_return_param = return_parameters[0]
         return_parameters.pop(0)
@@ -224,22 +1314,15 @@ class GoTranslator:
         return_types = [param.type for param in return_parameters]
         return_types[-1] = 'error'
         return_var_names = ['res_' + param.name for param in return_parameters]
-        return_var_names_string = ', '.join(return_var_names)
+        return return_var_names, return_types
+
+    def _generate_return_vars_init(self, return_var_names, return_types):
         return_vars_init = []
         for name, type in zip(return_var_names, return_types):
             return_vars_init.append(f'var {name} {type}')
-        return_vars_init_string = '\n\t'.join(return_vars_init)
-
-        return_types_string = ', '.join(return_types)
+        return '\n\t'.join(return_vars_init)
 
-        params = go_param_string(go_indy_function.parameters[1:])
-
-        signature = f'func {go_indy_function.name}({params}) ({return_types_string})'
-
-        register_call = _REGISTER_CALL.format(function_name=indy_function_name,
-                                              result_var_names=return_var_names_string)
-        # handle = FunctionParameter('commandHandle', 'int32')
-        # variables = [handle] + go_indy_function.parameters
+    def _generate_c_call(self, go_indy_function, c_proxy_name):
         variables = go_indy_function.parameters
 
         variable_names, variable_passing, variable_setups = self._setup_variables(variables)
@@ -248,18 +1331,19 @@ class GoTranslator:
         variable_passing.insert(0, 'pointer')
         variable_names = ', '.join(variable_passing)
 
-        c_call = f'code := C.{c_proxy_name}({variable_names})'
-        c_call_check = _C_CALL_CHECK.format(result_var_names=return_var_names_string)
+        return variable_setup_string, f'code := C.{c_proxy_name}({variable_names})'
 
+    def _generate_result_processing(self, result_retrieval, return_var_names, decoded_results):
+        return_var_names_string = ', '.join(return_var_names)
         result_var_assignments = [f'{var_name} = res.{var_name.replace("res_", "")}' for var_name in return_var_names
                                   if var_name != 'res_err']
         result_var_assignment_string = '\n\t' + '\n\t'.join(result_var_assignments)
         retrieval_and_check = result_retrieval + f'\t\treturn {return_var_names_string}\n\t}}\n'
+        if decoded_results:
+            retrieval_and_check += _RESULT_DECODE_CHECK.format(result_var_names=return_var_names_string)
 
-        return (f'{signature} {{\n\t{return_vars_init_string}\n\t{register_call}'
-                f'\n\n\t{variable_setup_string}\n\n\t{c_call}\t{c_call_check}'
-                f'\t{retrieval_and_check}'
-                f'\t{result_var_assignment_string}\n\n\treturn {return_var_names_string}\n}}')
+        return (f'\t{retrieval_and_check}'
+                f'\t{result_var_assignment_string}\n\n\treturn {return_var_names_string}')
 
     def _setup_variables(self, variables):
         variable_names = []
@@ -277,19 +1361,36 @@ class GoTranslator:
 
         return variable_names, variable_passings, variable_setups
 
-    def _setup_go_variables(self, names, types):
+    def _setup_go_variables(self, names, types, decoded_results):
         go_variable_names = []
         go_variable_declarations = []
         go_variable_setups = []
 
         for callback_param_name, callback_param_type in zip(names, types):
-            name, declaration, setup = self._setup_go_var(callback_param_name, callback_param_type)
+            if callback_param_name in decoded_results:
+                name, declaration, setup = self._setup_decoded_go_var(callback_param_name,
+                                                                      decoded_results[callback_param_name])
+            else:
+                name, declaration, setup = self._setup_go_var(callback_param_name, callback_param_type)
             go_variable_names.append(name)
             go_variable_declarations.append(declaration)
             go_variable_setups.append(setup)
 
+        if decoded_results:
+            go_variable_declarations.append('var go_decodeErr error')
+
         return go_variable_names, go_variable_declarations, go_variable_setups
 
+    def _setup_decoded_go_var(self, var_name, type_name):
+        go_var_name = 'go_' + var_name
+        go_var_declaration = f'var {go_var_name} *{type_name}'
+        decoded_var_name = go_var_name + 'Value'
+        setup = (f'if {var_name} != nil {{\n\t\t{decoded_var_name} := &{type_name}{{}}\n\t\t'
+                 f'if null, decodeErr := decodeCStringJSON({var_name}, {decoded_var_name}.decodeJSON); decodeErr != nil {{\n\t\t\t'
+                 f'go_decodeErr = fmt.Errorf("Failed to decode {var_name}. Error: %s", decodeErr)\n\t\t'
+                 f'}} else if !null {{\n\t\t\t{go_var_name} = {decoded_var_name}\n\t\t}}\n\t}}')
+        return go_var_name, go_var_declaration, setup
+
     def _setup_go_var(self, var_name, var_type):
         go_var_name = 'go_' + var_name
         go_var_type = self.CGO_TO_GO_TYPES[var_type]
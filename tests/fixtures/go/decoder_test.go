@@ -0,0 +1,196 @@
+package indy
+
+import (
+	"encoding/json"
+	"reflect"
+	"strings"
+	"testing"
+)
+
+func decodeCredential(t *testing.T, input string) *Credential {
+	t.Helper()
+
+	credential := &Credential{}
+	null, err := decodeJSON([]byte(input), credential.decodeJSON)
+	if err != nil {
+		t.Fatalf("decoding %s: %s", input, err)
+	}
+	if null {
+		t.Fatalf("decoding %s: unexpected null", input)
+	}
+	return credential
+}
+
+func TestDecodeEscapes(t *testing.T) {
+	credential := decodeCredential(t, `{"referent": "q\"b\\s\/n\nt\tr\rb\bf\f\u00e9\u20AC"}`)
+
+	expected := "q\"b\\s/n\nt\tr\rb\bf\f\u00e9\u20ac"
+	if credential.Referent != expected {
+		t.Fatalf("got %q, expected %q", credential.Referent, expected)
+	}
+}
+
+func TestDecodeSurrogatePairs(t *testing.T) {
+	cases := map[string]string{
+		`"\ud83d\ude00"`:       "\U0001F600",
+		`"a\ud83dx"`:           "a\uFFFDx",
+		`"\ud83d\u0041"`:       "\uFFFDA",
+		`"\ude00"`:             "\uFFFD",
+		`"\ud83d\ud83d\ude00"`: "\uFFFD\U0001F600",
+	}
+	for input, expected := range cases {
+		credential := decodeCredential(t, `{"referent": `+input+`}`)
+		if credential.Referent != expected {
+			t.Errorf("%s: got %q, expected %q", input, credential.Referent, expected)
+		}
+	}
+}
+
+func TestDecodeNestedValues(t *testing.T) {
+	input := `{
+		"referent": "cred-1",
+		"attrs": {"name": {"raw": "Alice", "list": [1, {"a": null}]}},
+		"values": ["a", "b", null],
+		"revocation": {"seq_no": 7, "id": "rev-1"},
+		"history": [{"seq_no": 1}, {"id": "rev-2", "seq_no": -2}],
+		"matrix": [[1, 2], [], [3]],
+		"count": 18446744073709551615,
+		"score": -1.5e3,
+		"valid": true
+	}`
+	credential := decodeCredential(t, input)
+
+	expected := &Credential{
+		Referent:   "cred-1",
+		Attrs:      json.RawMessage(`{"name": {"raw": "Alice", "list": [1, {"a": null}]}}`),
+		Values:     []string{"a", "b", ""},
+		Revocation: Revocation{SeqNo: 7, Id: "rev-1"},
+		History:    []Revocation{{SeqNo: 1}, {Id: "rev-2", SeqNo: -2}},
+		Matrix:     [][]int64{{1, 2}, nil, {3}},
+		Count:      18446744073709551615,
+		Score:      -1500,
+		Valid:      true,
+	}
+	if !reflect.DeepEqual(credential, expected) {
+		t.Fatalf("got %+v, expected %+v", credential, expected)
+	}
+}
+
+func TestDecodedStructRoundTripsThroughEncodingJSON(t *testing.T) {
+	credential := decodeCredential(t, `{"referent": "cred-1", "attrs": {"a": [1, "x"]}}`)
+
+	encoded, err := json.Marshal(credential)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if !strings.Contains(string(encoded), `"attrs":{"a":[1,"x"]}`) {
+		t.Fatalf("raw field not preserved: %s", encoded)
+	}
+
+	var decoded Credential
+	if err := json.Unmarshal(encoded, &decoded); err != nil {
+		t.Fatal(err)
+	}
+	if decoded.Referent != "cred-1" || string(decoded.Attrs) != `{"a":[1,"x"]}` {
+		t.Fatalf("round trip mismatch: %+v", decoded)
+	}
+}
+
+func TestDecodeSkipsUnknownKeys(t *testing.T) {
+	input := `{"unknown": {"deep": [1, [2, {"x": "\"}"}], true, false, null, -0.5e-3]},
+		"referent": "cred-1", "other": "\ud83d\ude00", "count": 3}`
+	credential := decodeCredential(t, input)
+
+	if credential.Referent != "cred-1" || credential.Count != 3 {
+		t.Fatalf("got %+v", credential)
+	}
+}
+
+func TestDecodeNullValues(t *testing.T) {
+	credential := decodeCredential(t, `{"referent": null, "attrs": null, "values": null, "revocation": null,
+		"count": null, "score": null, "valid": null}`)
+	if !reflect.DeepEqual(credential, &Credential{Attrs: json.RawMessage("null")}) {
+		t.Fatalf("got %+v", credential)
+	}
+
+	null, err := decodeJSON([]byte(" null "), (&Credential{}).decodeJSON)
+	if err != nil || !null {
+		t.Fatalf("got null=%v err=%v for a null document", null, err)
+	}
+}
+
+func TestDecodeMalformedInput(t *testing.T) {
+	inputs := []string{
+		``,
+		`{`,
+		`[]`,
+		`{"referent"}`,
+		`{"referent": }`,
+		`{"referent": "x"`,
+		`{"referent": "x",}`,
+		`{"referent": "x"} trailing`,
+		`{"referent": "x" "count": 1}`,
+		`{"referent": "unterminated}`,
+		"{\"referent\": \"control\x01\"}",
+		`{"referent": "\x"}`,
+		`{"referent": "\u12"}`,
+		`{"referent": "\u12zz"}`,
+		`{"referent": 1}`,
+		`{"count": 1.5}`,
+		`{"count": -1}`,
+		`{"revocation": {"seq_no": "7"}}`,
+		`{"score": "x"}`,
+		`{"valid": tru}`,
+		`{"valid": 1}`,
+		`{"values": ["a" "b"]}`,
+		`{"matrix": [[1, 2]}`,
+		`{"unknown": nul}`,
+	}
+	for _, input := range inputs {
+		_, err := decodeJSON([]byte(input), (&Credential{}).decodeJSON)
+		if err == nil {
+			t.Errorf("%q: expected an error", input)
+		} else if !strings.Contains(err.Error(), "Invalid JSON at offset") {
+			t.Errorf("%q: unexpected error format: %s", input, err)
+		}
+	}
+}
+
+func TestCallbackDecodesResult(t *testing.T) {
+	result := `{"referent": "cred-1", "revocation": {"seq_no": 3}}`
+	defer setFakeResult(&result)()
+
+	credential, err := ProverGetCredential(1, "cred-1")
+	if err != nil {
+		t.Fatal(err)
+	}
+	if credential == nil || credential.Referent != "cred-1" || credential.Revocation.SeqNo != 3 {
+		t.Fatalf("got %+v", credential)
+	}
+}
+
+func TestCallbackNullResult(t *testing.T) {
+	result := "null"
+	release := setFakeResult(&result)
+	credential, err := ProverGetCredential(1, "cred-1")
+	release()
+	if err != nil || credential != nil {
+		t.Fatalf("got %+v, %v for a null result", credential, err)
+	}
+
+	defer setFakeResult(nil)()
+	credential, err = ProverGetCredential(1, "cred-1")
+	if err != nil || credential != nil {
+		t.Fatalf("got %+v, %v for a NULL string", credential, err)
+	}
+}
+
+func TestCallbackMalformedResult(t *testing.T) {
+	result := `{"referent": `
+	defer setFakeResult(&result)()
+
+	credential, err := ProverGetCredential(1, "cred-1")
+	if err == nil || !strings.Contains(err.Error(), "Failed to decode credentialJson") {
+		t.Fatalf("got %+v, %v", credential, err)
+	}
+}
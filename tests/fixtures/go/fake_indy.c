@@ -0,0 +1,30 @@
+#include <stdint.h>
+#include <stddef.h>
+
+extern int32_t fakeOpenPoolLedger(char *config_name, int32_t *handle);
+extern int32_t fakeClosePoolLedger(int32_t handle);
+
+static char *fake_result = NULL;
+
+void set_fake_result(char *result) {
+	fake_result = result;
+}
+
+int32_t fake_open_pool_ledger(int32_t command_handle, char *config_name, char *config,
+                              void (*cb)(int32_t, int32_t, int32_t)) {
+	int32_t handle = 0;
+	int32_t err = fakeOpenPoolLedger(config_name, &handle);
+	cb(command_handle, err, handle);
+	return 0;
+}
+
+int32_t fake_close_pool_ledger(int32_t command_handle, int32_t handle, void (*cb)(int32_t, int32_t)) {
+	cb(command_handle, fakeClosePoolLedger(handle));
+	return 0;
+}
+
+int32_t fake_prover_get_credential(int32_t command_handle, int32_t wallet_handle, char *cred_id,
+                                   void (*cb)(int32_t, int32_t, char *)) {
+	cb(command_handle, 0, fake_result);
+	return 0;
+}
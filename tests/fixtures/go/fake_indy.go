@@ -0,0 +1,114 @@
+package indy
+
+/*
+#include <stdint.h>
+#include <stdlib.h>
+int32_t fake_open_pool_ledger(int32_t, char *, char *, void (*)(int32_t, int32_t, int32_t));
+int32_t fake_close_pool_ledger(int32_t, int32_t, void (*)(int32_t, int32_t));
+void set_fake_result(char *result);
+int32_t fake_prover_get_credential(int32_t, int32_t, char *, void (*)(int32_t, int32_t, char *));
+*/
+import "C"
+
+import (
+	"sync"
+	"unsafe"
+)
+
+const fakeAlreadyOpenedError = 306
+
+func init() {
+	resolver.pointers["indy_open_pool_ledger"] = unsafe.Pointer(C.fake_open_pool_ledger)
+	resolver.pointers["indy_close_pool_ledger"] = unsafe.Pointer(C.fake_close_pool_ledger)
+	resolver.pointers["indy_prover_get_credential"] = unsafe.Pointer(C.fake_prover_get_credential)
+}
+
+// fakePool mimics libindy refusing to open a pool that is already open.
+// beforeOpen and beforeClose run on the calling goroutine and let tests
+// hold an open or close in flight.
+type fakePool struct {
+	mu          sync.Mutex
+	next        int32
+	open        map[int32]string
+	opens       int
+	closes      int
+	beforeOpen  func()
+	beforeClose func()
+}
+
+var pool = &fakePool{open: make(map[int32]string)}
+
+func resetFakePool() {
+	pool.mu.Lock()
+	defer pool.mu.Unlock()
+
+	pool.open = make(map[int32]string)
+	pool.opens = 0
+	pool.closes = 0
+	pool.beforeOpen = nil
+	pool.beforeClose = nil
+}
+
+func (p *fakePool) counts() (opens int, closes int, open int) {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+
+	return p.opens, p.closes, len(p.open)
+}
+
+//export fakeOpenPoolLedger
+func fakeOpenPoolLedger(configName *C.char, handle *C.int32_t) C.int32_t {
+	name := C.GoString(configName)
+	pool.mu.Lock()
+	beforeOpen := pool.beforeOpen
+	pool.mu.Unlock()
+	if beforeOpen != nil {
+		beforeOpen()
+	}
+
+	pool.mu.Lock()
+	defer pool.mu.Unlock()
+
+	pool.opens++
+	for _, openName := range pool.open {
+		if openName == name {
+			return fakeAlreadyOpenedError
+		}
+	}
+	pool.next++
+	pool.open[pool.next] = name
+	*handle = C.int32_t(pool.next)
+	return 0
+}
+
+//export fakeClosePoolLedger
+func fakeClosePoolLedger(handle C.int32_t) C.int32_t {
+	pool.mu.Lock()
+	beforeClose := pool.beforeClose
+	pool.mu.Unlock()
+	if beforeClose != nil {
+		beforeClose()
+	}
+
+	pool.mu.Lock()
+	defer pool.mu.Unlock()
+
+	pool.closes++
+	delete(pool.open, int32(handle))
+	return 0
+}
+
+// setFakeResult makes the fake libindy return result, or a NULL string if
+// result is nil. The returned function releases the C copy.
+func setFakeResult(result *string) func() {
+	if result == nil {
+		C.set_fake_result(nil)
+		return func() {}
+	}
+	c_result := C.CString(*result)
+	C.set_fake_result(c_result)
+	return func() {
+		C.set_fake_result(nil)
+		C.free(unsafe.Pointer(c_result))
+	}
+}
@@ -0,0 +1,111 @@
+package indy
+
+import (
+	"testing"
+)
+
+func newPendingFuture() *ProverGetCredentialFuture {
+	future := &ProverGetCredentialFuture{}
+	future.init(future)
+	return future
+}
+
+func expectPanic(t *testing.T, name string, f func()) {
+	t.Helper()
+	defer func() {
+		if recover() == nil {
+			t.Errorf("%s: expected a panic", name)
+		}
+	}()
+	f()
+}
+
+func TestAsyncCallbackDecodesResult(t *testing.T) {
+	result := `{"referent": "cred-1", "revocation": {"seq_no": 3}}`
+	defer setFakeResult(&result)()
+
+	future, err := ProverGetCredentialAsync(1, "cred-1")
+	if err != nil {
+		t.Fatal(err)
+	}
+	credential, err := future.Wait()
+	if err != nil || credential == nil || credential.Referent != "cred-1" || credential.Revocation.SeqNo != 3 {
+		t.Fatalf("got %+v, %v", credential, err)
+	}
+	select {
+	case <-future.Done():
+	default:
+		t.Fatalf("Done is not closed after Wait returned")
+	}
+}
+
+func TestCompletionQueueOrdersByCompletion(t *testing.T) {
+	queue := NewCompletionQueue()
+	first, second := newPendingFuture(), newPendingFuture()
+	queue.Add(first)
+	queue.Add(second)
+
+	second.complete(int32(0))
+	if next := queue.Next(); next != Future(second) {
+		t.Fatalf("got %v, expected the second future", next)
+	}
+	if ready := queue.Poll(nil); len(ready) != 0 {
+		t.Fatalf("got %d ready futures, expected none", len(ready))
+	}
+
+	first.complete(int32(0))
+	if ready := queue.Drain(nil); len(ready) != 1 || ready[0] != Future(first) {
+		t.Fatalf("got %v, expected the first future", ready)
+	}
+	if queue.Pending() != 0 || queue.Next() != nil {
+		t.Fatalf("queue should be empty")
+	}
+}
+
+func TestCompletionQueueDrainsAsyncCalls(t *testing.T) {
+	result := `{"referent": "cred-1"}`
+	defer setFakeResult(&result)()
+
+	queue := NewCompletionQueue()
+	for i := 0; i < 64; i++ {
+		future, err := ProverGetCredentialAsync(1, "cred-1")
+		if err != nil {
+			t.Fatal(err)
+		}
+		queue.Add(future)
+	}
+
+	var ready []Future
+	for queue.Pending() > 0 {
+		ready = queue.Drain(ready)
+	}
+	if len(ready) != 64 {
+		t.Fatalf("got %d futures, expected 64", len(ready))
+	}
+	for _, future := range ready {
+		credential, err := future.(*ProverGetCredentialFuture).Wait()
+		if err != nil || credential.Referent != "cred-1" {
+			t.Fatalf("got %+v, %v", credential, err)
+		}
+	}
+}
+
+func TestCompletionQueueRejectsRepeatedAdd(t *testing.T) {
+	queue, other := NewCompletionQueue(), NewCompletionQueue()
+	pending, completed := newPendingFuture(), newPendingFuture()
+	completed.complete(int32(0))
+	queue.Add(pending)
+	queue.Add(completed)
+
+	expectPanic(t, "same queue", func() { queue.Add(pending) })
+	expectPanic(t, "other queue", func() { other.Add(pending) })
+	expectPanic(t, "completed future", func() { other.Add(completed) })
+
+	pending.complete(int32(0))
+	if ready := queue.Drain(nil); len(ready) != 2 || queue.Pending() != 0 {
+		t.Fatalf("got %d ready futures and %d pending", len(ready), queue.Pending())
+	}
+	if other.Pending() != 0 {
+		t.Fatalf("other queue counted %d pending futures", other.Pending())
+	}
+}
@@ -0,0 +1,291 @@
+package indy
+
+import (
+	"sync"
+	"testing"
+	"time"
+)
+
+// waitFor polls condition until it holds or a second has passed.
+func waitFor(t *testing.T, what string, condition func() bool) {
+	t.Helper()
+
+	deadline := time.Now().Add(time.Second)
+	for !condition() {
+		if time.Now().After(deadline) {
+			t.Fatalf("timed out waiting for %s", what)
+		}
+		time.Sleep(time.Millisecond)
+	}
+}
+
+// blockOpens makes fake opens wait until the returned function is called.
+func blockOpens() (started chan struct{}, unblock func()) {
+	started = make(chan struct{}, 16)
+	gate := make(chan struct{})
+	pool.mu.Lock()
+	pool.beforeOpen = func() {
+		started <- struct{}{}
+		<-gate
+	}
+	pool.mu.Unlock()
+	return started, func() { close(gate) }
+}
+
+func TestHandlesShareConcurrentOpens(t *testing.T) {
+	resetFakePool()
+	handles := NewPoolLedgerHandles(0, nil)
+	started, unblock := blockOpens()
+
+	const callers = 10
+	results := make(chan int32, callers)
+	var wg sync.WaitGroup
+	for i := 0; i < callers; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			handle, err := handles.Open("pool", "{}")
+			if err != nil {
+				t.Error(err)
+			}
+			results <- handle
+		}()
+	}
+	<-started
+	waitFor(t, "all callers to join the open", func() bool {
+		return handles.Stats().Hits == callers-1
+	})
+	unblock()
+	wg.Wait()
+	close(results)
+
+	first := <-results
+	for handle := range results {
+		if handle != first {
+			t.Fatalf("got handles %d and %d for the same key", first, handle)
+		}
+	}
+	if opens, _, _ := pool.counts(); opens != 1 {
+		t.Fatalf("got %d libindy opens, expected 1", opens)
+	}
+	stats := handles.Stats()
+	if stats.Hits != callers-1 || stats.Misses != 1 || stats.Open != 1 {
+		t.Fatalf("got stats %+v", stats)
+	}
+}
+
+func TestHandlesCloseAfterLastRelease(t *testing.T) {
+	resetFakePool()
+	closed := make(chan int32, 1)
+	handles := NewPoolLedgerHandles(0, func(handle int32, err error) {
+		closed <- handle
+	})
+
+	first, err := handles.Open("pool", "{}")
+	if err != nil {
+		t.Fatal(err)
+	}
+	second, err := handles.Open("pool", "{}")
+	if err != nil || second != first {
+		t.Fatalf("got %d, %v, expected handle %d", second, err, first)
+	}
+	other, err := handles.Open("other", "{}")
+	if err != nil || other == first {
+		t.Fatalf("got %d, %v for a different key", other, err)
+	}
+
+	if err := handles.Release(first); err != nil {
+		t.Fatal(err)
+	}
+	if _, closes, _ := pool.counts(); closes != 0 {
+		t.Fatalf("handle closed while still in use")
+	}
+	if err := handles.Release(first); err != nil {
+		t.Fatal(err)
+	}
+	if handle := <-closed; handle != first {
+		t.Fatalf("onClose got handle %d, expected %d", handle, first)
+	}
+
+	if err := handles.Release(first); err == nil {
+		t.Fatalf("expected an error releasing a closed handle")
+	}
+	if err := handles.Release(12345); err == nil {
+		t.Fatalf("expected an error releasing an unknown handle")
+	}
+	if stats := handles.Stats(); stats.Hits != 1 || stats.Misses != 2 || stats.Open != 1 {
+		t.Fatalf("got stats %+v", stats)
+	}
+}
+
+func TestHandlesEvictIdleHandles(t *testing.T) {
+	resetFakePool()
+	closed := make(chan int32, 1)
+	handles := NewPoolLedgerHandles(20*time.Millisecond, func(handle int32, err error) {
+		if err != nil {
+			t.Error(err)
+		}
+		closed <- handle
+	})
+
+	handle, err := handles.Open("pool", "{}")
+	if err != nil {
+		t.Fatal(err)
+	}
+	if err := handles.Release(handle); err != nil {
+		t.Fatal(err)
+	}
+	reopened, err := handles.Open("pool", "{}")
+	if err != nil || reopened != handle {
+		t.Fatalf("got %d, %v, expected the idle handle %d back", reopened, err, handle)
+	}
+	if err := handles.Release(reopened); err != nil {
+		t.Fatal(err)
+	}
+
+	select {
+	case evicted := <-closed:
+		if evicted != handle {
+			t.Fatalf("evicted %d, expected %d", evicted, handle)
+		}
+	case <-time.After(time.Second):
+		t.Fatalf("idle handle was not evicted")
+	}
+	stats := handles.Stats()
+	if stats.Hits != 1 || stats.Misses != 1 || stats.Evictions != 1 || stats.Open != 0 {
+		t.Fatalf("got stats %+v", stats)
+	}
+	if _, closes, open := pool.counts(); closes != 1 || open != 0 {
+		t.Fatalf("got %d closes and %d open handles", closes, open)
+	}
+}
+
+func TestHandlesRejectExtraRelease(t *testing.T) {
+	resetFakePool()
+	handles := NewPoolLedgerHandles(20*time.Millisecond, nil)
+
+	handle, err := handles.Open("pool", "{}")
+	if err != nil {
+		t.Fatal(err)
+	}
+	if err := handles.Release(handle); err != nil {
+		t.Fatal(err)
+	}
+	if err := handles.Release(handle); err == nil {
+		t.Fatalf("expected an error for the extra release")
+	}
+
+	held, err := handles.Open("pool", "{}")
+	if err != nil || held != handle {
+		t.Fatalf("got %d, %v", held, err)
+	}
+	other, err := handles.Open("pool", "{}")
+	if err != nil {
+		t.Fatal(err)
+	}
+	if err := handles.Release(other); err != nil {
+		t.Fatal(err)
+	}
+
+	time.Sleep(60 * time.Millisecond)
+	if stats := handles.Stats(); stats.Evictions != 0 || stats.Open != 1 {
+		t.Fatalf("handle evicted while held: %+v", stats)
+	}
+	if _, closes, _ := pool.counts(); closes != 0 {
+		t.Fatalf("handle closed while held")
+	}
+}
+
+func TestHandlesReopenWaitsForClose(t *testing.T) {
+	resetFakePool()
+	handles := NewPoolLedgerHandles(0, nil)
+
+	handle, err := handles.Open("pool", "{}")
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	closeStarted := make(chan struct{})
+	closeGate := make(chan struct{})
+	pool.mu.Lock()
+	pool.beforeClose = func() {
+		close(closeStarted)
+		<-closeGate
+	}
+	pool.mu.Unlock()
+
+	released := make(chan error)
+	go func() {
+		released <- handles.Release(handle)
+	}()
+	<-closeStarted
+
+	reopened := make(chan error)
+	go func() {
+		_, err := handles.Open("pool", "{}")
+		reopened <- err
+	}()
+	time.Sleep(20 * time.Millisecond)
+	if opens, _, _ := pool.counts(); opens != 1 {
+		t.Fatalf("reopen reached libindy while the handle was still closing")
+	}
+
+	close(closeGate)
+	if err := <-released; err != nil {
+		t.Fatal(err)
+	}
+	if err := <-reopened; err != nil {
+		t.Fatalf("reopen failed: %s", err)
+	}
+	if opens, closes, open := pool.counts(); opens != 2 || closes != 1 || open != 1 {
+		t.Fatalf("got %d opens, %d closes, %d open handles", opens, closes, open)
+	}
+}
+
+func TestHandlesCloseAllWaitsForInFlightOpen(t *testing.T) {
+	resetFakePool()
+	handles := NewPoolLedgerHandles(time.Minute, nil)
+
+	idle, err := handles.Open("idle", "{}")
+	if err != nil {
+		t.Fatal(err)
+	}
+	if err := handles.Release(idle); err != nil {
+		t.Fatal(err)
+	}
+
+	started, unblock := blockOpens()
+	opened := make(chan error)
+	go func() {
+		_, err := handles.Open("pool", "{}")
+		opened <- err
+	}()
+	<-started
+
+	closedAll := make(chan error)
+	go func() {
+		closedAll <- handles.CloseAll()
+	}()
+	select {
+	case <-closedAll:
+		t.Fatalf("CloseAll returned while an open was in flight")
+	case <-time.After(20 * time.Millisecond):
+	}
+
+	unblock()
+	if err := <-opened; err == nil {
+		t.Fatalf("expected the in-flight open to fail after CloseAll")
+	}
+	if err := <-closedAll; err != nil {
+		t.Fatal(err)
+	}
+	if _, closes, open := pool.counts(); closes != 2 || open != 0 {
+		t.Fatalf("got %d closes and %d open handles after CloseAll", closes, open)
+	}
+	if _, err := handles.Open("pool", "{}"); err == nil {
+		t.Fatalf("expected Open to fail after CloseAll")
+	}
+	if stats := handles.Stats(); stats.Open != 0 {
+		t.Fatalf("got stats %+v after CloseAll", stats)
+	}
+}
@@ -0,0 +1,37 @@
+package indy
+
+import (
+	"sync"
+	"unsafe"
+)
+
+type stubResolver struct {
+	mu       sync.Mutex
+	next     int32
+	calls    map[int32]chan interface{}
+	pointers map[string]unsafe.Pointer
+}
+
+var resolver = &stubResolver{
+	calls:    make(map[int32]chan interface{}),
+	pointers: make(map[string]unsafe.Pointer),
+}
+
+func (r *stubResolver) RegisterCall(name string) (unsafe.Pointer, int32, chan interface{}, error) {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+
+	r.next++
+	resCh := make(chan interface{}, 1)
+	r.calls[r.next] = resCh
+	return r.pointers[name], r.next, resCh, nil
+}
+
+func (r *stubResolver) DeregisterCall(commandHandle int32) (chan interface{}, error) {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+
+	resCh := r.calls[commandHandle]
+	delete(r.calls, commandHandle)
+	return resCh, nil
+}
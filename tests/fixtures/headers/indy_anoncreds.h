@@ -0,0 +1,7 @@
+extern indy_error_t indy_prover_get_credential(indy_handle_t command_handle,
+                                               indy_handle_t wallet_handle,
+                                               const char *  cred_id,
+                                               void (*cb)(indy_handle_t xcommand_handle,
+                                                          indy_error_t  err,
+                                                          const char *  credential_json)
+                                              );
@@ -0,0 +1,13 @@
+extern indy_error_t indy_open_pool_ledger(indy_handle_t command_handle,
+                                          const char *  config_name,
+                                          const char *  config,
+                                          void (*cb)(indy_handle_t xcommand_handle,
+                                                     indy_error_t  err,
+                                                     indy_handle_t pool_handle)
+                                         );
+
+extern indy_error_t indy_close_pool_ledger(indy_handle_t command_handle,
+                                           indy_handle_t handle,
+                                           void (*cb)(indy_handle_t xcommand_handle,
+                                                      indy_error_t  err)
+                                          );
@@ -0,0 +1,2 @@
+typedef int32_t indy_handle_t;
+typedef int32_t indy_error_t;
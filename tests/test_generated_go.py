@@ -0,0 +1,27 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from indy_gen.generator import Generator
+
+
+FIXTURES_PATH = os.path.join(os.path.dirname(__file__), 'fixtures')
+GO = shutil.which('go') or shutil.which('go', path='/usr/local/go/bin')
+
+
+@pytest.mark.skipif(GO is None, reason='Go toolchain not available')
+def test_generated_go_package(tmp_path):
+    generator = Generator(str(tmp_path), os.path.join(FIXTURES_PATH, 'headers'), handle_managers=True,
+                          result_schema_path=os.path.join(FIXTURES_PATH, 'result_schema.json'),
+                          async_variants=True)
+    generator.generate_output_files()
+
+    go_fixtures_path = os.path.join(FIXTURES_PATH, 'go')
+    for file_name in os.listdir(go_fixtures_path):
+        shutil.copy(os.path.join(go_fixtures_path, file_name), tmp_path)
+    (tmp_path / 'go.mod').write_text('module indy\n\ngo 1.21\n')
+
+    result = subprocess.run([GO, 'test', '-race', './...'], cwd=tmp_path, capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr
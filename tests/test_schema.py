@@ -0,0 +1,87 @@
+import json
+import os
+
+import pytest
+
+from indy_gen.generator import Generator, GeneratorError
+from indy_gen.schema import ResultSchema, SchemaError
+
+
+FIXTURES_PATH = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def write_schema(tmp_path, content):
+    schema_path = tmp_path / 'schema.json'
+    schema_path.write_text(json.dumps(content))
+    return str(schema_path)
+
+
+def test_load_fixture_schema():
+    schema = ResultSchema.load(os.path.join(FIXTURES_PATH, 'result_schema.json'))
+
+    fields = {field.json_name: field for field in schema.types['Revocation'].fields}
+    assert fields['seq_no'].go_name == 'SeqNo'
+    assert schema.results_for('indy_prover_get_credential') == {'credentialJson': 'Credential'}
+
+
+@pytest.mark.parametrize('types', [
+    {'T': {'cred_def_id': 'string', 'credDefId': 'string'}},
+    {'T': {'a': 'Missing'}},
+    {'raw': {'a': 'string'}},
+    {'error': {'a': 'string'}},
+    {'My-Type': {'a': 'string'}},
+    {'T': {'1st': 'string'}},
+    {'Node': {'next': 'Node'}},
+    {'A': {'b': 'B'}, 'B': {'c': 'C'}, 'C': {'a': 'A'}},
+    {'Future': {'a': 'string'}},
+    {'CompletionQueue': {'a': 'string'}},
+    {'HandleCacheStats': {'a': 'string'}},
+    {'ProverGetCredentialFuture': {'a': 'string'}},
+    {'proverGetCredentialResult': {'a': 'string'}},
+    {'PoolLedgerHandles': {'a': 'string'}},
+])
+def test_invalid_types_are_rejected(tmp_path, types):
+    with pytest.raises(SchemaError):
+        ResultSchema.load(write_schema(tmp_path, {'types': types}))
+
+
+@pytest.mark.parametrize('content', [
+    [],
+    {'types': []},
+    {'types': {'T': ['string']}},
+    {'types': {'T': {'a': {'x': 'string'}}}},
+    {'functions': ['indy_prover_get_credential']},
+    {'functions': {'indy_prover_get_credential': 'T'}},
+    {'types': {'T': {'a': 'string'}}, 'functions': {'indy_prover_get_credential': {'credential_json': ['T']}}},
+])
+def test_malformed_schemas_are_rejected(tmp_path, content):
+    with pytest.raises(SchemaError):
+        ResultSchema.load(write_schema(tmp_path, content))
+
+
+def test_recursion_through_arrays_is_allowed(tmp_path):
+    schema = ResultSchema.load(write_schema(tmp_path, {'types': {'Node': {'children': '[]Node', 'parent': 'Leaf'},
+                                                                 'Leaf': {'nodes': '[][]Node'}}}))
+    assert set(schema.types) == {'Node', 'Leaf'}
+
+
+def test_unknown_result_type_is_rejected(tmp_path):
+    schema_path = write_schema(tmp_path, {'functions': {'indy_prover_get_credential': {'credential_json': 'T'}}})
+    with pytest.raises(SchemaError):
+        ResultSchema.load(schema_path)
+
+
+@pytest.mark.parametrize('functions', [
+    {'indy_prover_get_credentialz': {'credential_json': 'T'}},
+    {'indy_prover_get_credential': {'credential': 'T'}},
+    {'indy_open_pool_ledger': {'pool_handle': 'T'}},
+])
+def test_invalid_schema_functions_are_rejected(tmp_path, functions):
+    schema_path = write_schema(tmp_path, {'types': {'T': {'a': 'string'}}, 'functions': functions})
+    output_path = tmp_path / 'output'
+    output_path.mkdir()
+
+    generator = Generator(str(output_path), os.path.join(FIXTURES_PATH, 'headers'), result_schema_path=schema_path)
+    with pytest.raises(GeneratorError):
+        generator.generate_output_files()
+    assert not os.listdir(output_path)